@@ -1,26 +1,37 @@
 """Intent normalization and detection primitives."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntentResult:
     normalized_text: str
     intent: str
 
 
+_GREETING_TOKENS = ("hello", "hi", "hey")
+_ASSIST_TOKENS = ("help", "how", "what", "why")
+_TOOLING_TOKENS = ("run", "execute", "tool")
+
+
 def normalize_text(raw_text: str) -> str:
     """Normalize user input for downstream intent and routing logic."""
     return " ".join(raw_text.strip().lower().split())
 
 
+@lru_cache(maxsize=1024)
 def detect_intent(normalized_text: str) -> str:
-    """Detect a coarse intent label using lightweight heuristics."""
-    if any(token in normalized_text for token in ("hello", "hi", "hey")):
+    """Detect a coarse intent label using lightweight heuristics.
+
+    Results are memoized on the normalized text so repeated inputs skip
+    the keyword scan.
+    """
+    if any(token in normalized_text for token in _GREETING_TOKENS):
         return "greeting"
-    if any(token in normalized_text for token in ("help", "how", "what", "why")):
+    if any(token in normalized_text for token in _ASSIST_TOKENS):
         return "assist"
-    if any(token in normalized_text for token in ("run", "execute", "tool")):
+    if any(token in normalized_text for token in _TOOLING_TOKENS):
         return "tooling"
     return "default"
 